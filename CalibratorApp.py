@@ -1,11 +1,34 @@
 import os
-import glob
+import re
+import mmap
+import tempfile
+import atexit
+import logging
+import concurrent.futures
 import tkinter as tk
 
+from color_math import compute_color
+
+logger = logging.getLogger(__name__)
+
+# Single worker thread for file writes, so saves never block the Tk event loop
+# and writes to the same file happen in submission order
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+atexit.register(_IO_POOL.shutdown, wait=True)
+
 # Constants for monitor calibration
 CALIBRATION_DIR = 'DisplaySettings'
 CALIBRATION_FILE = os.path.join(CALIBRATION_DIR, 'UserDisplayCalibration.txt')
 
+# Line formatters for the calibration file ("level:wb,tint") and
+# phone profile files ("ProfileName | Temperature | WBCorrection | TintCorrection")
+_CALIBRATION_FMT = "{}:{},{}\n".format
+_PROFILE_FMT = "{} | {} | {:.1f} | {:.1f}".format
+
+# Parser for a calibration line: captures level, white balance and tint
+_NUMBER = r'(-?\d+\.?\d*(?:[eE][-+]?\d+)?)'
+_CALIBRATION_RE = re.compile(r'^\s*([^:]+?)\s*:\s*' + _NUMBER + r'\s*,\s*' + _NUMBER + r'\s*$')
+
 # Constants for phone profile settings
 CCT_SETTINGS_DIR = 'CCT_Settings'
 
@@ -27,58 +50,177 @@ test_color_values = {
     "White": 255
 }
 
-def clamp(value, min_val=0, max_val=255):
-    """Clamp the value within the specified range and return an integer."""
-    return max(min_val, min(int(round(value)), max_val))
-
-def compute_color(base, wb, tint):
-    """
-    Compute the final color.
-    The white balance (wb) correction increases red and decreases blue;
-    the tint correction is applied to the green channel.
-    """
-    r = clamp(base + wb)
-    g = clamp(base + tint)
-    b = clamp(base - wb)
-    return f'#{r:02x}{g:02x}{b:02x}'
-
 def load_calibration_data():
     """Load monitor calibration data from file."""
     calibration_values = {}
     if os.path.exists(CALIBRATION_FILE):
-        with open(CALIBRATION_FILE, 'r') as f:
+        with open(CALIBRATION_FILE, 'r', encoding='utf-8-sig', errors='surrogateescape') as f:
             for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    level, params = line.split(':')
-                    wb, tint = params.split(',')
-                    calibration_values[level.strip().lower()] = {
-                        'white_balance': float(wb),
-                        'tint': float(tint)
+                m = _CALIBRATION_RE.match(line)
+                if m:
+                    calibration_values[m.group(1).lower()] = {
+                        'white_balance': float(m.group(2)),
+                        'tint': float(m.group(3))
                     }
-                except Exception as e:
-                    print("Error parsing calibration line:", line, e)
+                elif line.strip():
+                    logger.warning("Error parsing calibration line: %s", line.strip())
     return calibration_values
 
 def save_calibration_data(calibration_values):
     """Save monitor calibration data to file."""
     if not os.path.exists(CALIBRATION_DIR):
         os.makedirs(CALIBRATION_DIR)
-    with open(CALIBRATION_FILE, 'w') as f:
-        for level, values in calibration_values.items():
-            f.write(f"{level}:{values['white_balance']},{values['tint']}\n")
-    print("Monitor calibration saved:", calibration_values)
+    payload = ''.join(_CALIBRATION_FMT(level, values['white_balance'], values['tint'])
+                      for level, values in calibration_values.items())
+    return write_file_async(CALIBRATION_FILE, payload, "Monitor calibration saved: %s", dict(calibration_values))
+
+def _write_file(path, text):
+    # Write a temp file next to the target and swap it in, so a reader on the Tk thread
+    # (possibly mmapping the file) never sees it truncated or half written
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        # newline='' writes the text as-is, so line endings kept from the original file are not translated again
+        # surrogateescape writes back undecodable bytes read by read_phone_profiles unchanged
+        with open(fd, 'w', encoding='utf-8', errors='surrogateescape', newline='') as f:
+            f.write(text)
+        # mkstemp creates the file owner-only; keep the permissions of the file being replaced
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def write_file_async(path, text, message, *args):
+    """
+    Write text to path on the background I/O thread so the GUI stays responsive.
+    message (with args) is logged once the write has finished.
+    """
+    def on_done(future):
+        error = future.exception()
+        if error is not None:
+            logger.error("Error writing %s: %s", path, error)
+        else:
+            logger.info(message, *args)
+    future = _IO_POOL.submit(_write_file, path, text)
+    future.add_done_callback(on_done)
+    return future
+
+def list_phone_files():
+    """Return the sorted names of the phone profile (.txt, any case) files in the CCT_Settings directory."""
+    if not os.path.exists(CCT_SETTINGS_DIR):
+        os.makedirs(CCT_SETTINGS_DIR)
+    with os.scandir(CCT_SETTINGS_DIR) as entries:
+        return sorted(e.name for e in entries if e.is_file() and e.name.lower().endswith('.txt'))
+
+def read_phone_profiles(filepath):
+    """
+    Parse a phone profile file.
+    Returns (profiles, lines): a dictionary profile name -> profile data, and every raw
+    line of the file as (profile name or None if unparsed, text) so it can be written back verbatim.
+    """
+    profiles = {}
+    lines = []
+    strip = str.strip
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return profiles, lines  # mmap cannot map an empty file
+        # Stream lines from the mapped file instead of copying it into one string
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for raw in iter(mm.readline, b''):
+                # Expected format: ProfileName | Temperature | WBCorrection | TintCorrection
+                # Files are written as UTF-8; 'utf-8-sig' drops a BOM left by editors like Notepad.
+                # Files saved by older versions in the locale encoding (e.g. cp1252) don't fail to
+                # load: their non-UTF-8 bytes are kept as surrogates and written back byte for byte
+                line = raw.decode('utf-8-sig', 'surrogateescape')
+                parts = line.split("|", 4)
+                if len(parts) < 4:
+                    lines.append((None, line))
+                    continue
+                name = strip(parts[0])
+                lines.append((name, line))
+                wb_corr = strip(parts[2])
+                tint_corr = strip(parts[3])
+                profiles[name] = {
+                    'temperature': strip(parts[1]),
+                    'wb_correction': float(wb_corr) if wb_corr and wb_corr != "NA" else 0.0,
+                    'tint_correction': float(tint_corr) if tint_corr and tint_corr != "NA" else 0.0
+                }
+    return profiles, lines
+
+# ------------------ Shared Background Painting ------------------
+class BackgroundPainter:
+    """
+    Base for both stages: paints the root window background, coalescing slider
+    events into deferred updates and previewing coarsely while a slider is dragged.
+    Subclasses implement update_background() and call paint_background() from it.
+    """
+    def __init__(self, root):
+        self.root = root
+        self._pending = None  # Pending Tk 'after' job for a deferred background update
+        self._last_bg = None  # Last color applied to the root window
+        # Configure the root background with a direct Tcl call, skipping Tkinter's option handling
+        self._tk_call = self.root.tk.call
+        self._root_path = str(self.root)
+        self._dragging = False  # True while a slider is held with the mouse
+    
+    def update_background(self):
+        raise NotImplementedError
+    
+    def schedule_update(self, delay=30):
+        """Coalesce rapid slider events into a single deferred background update."""
+        if self._pending:
+            self.root.after_cancel(self._pending)
+        self._pending = self.root.after(delay, self._do_update)
+    
+    def _do_update(self):
+        self._pending = None
+        self.update_background()
+    
+    def on_drag_start(self, event):
+        self._dragging = True
+    
+    def on_drag_end(self, event):
+        # Render the final slider position at full precision
+        self._dragging = False
+        self.schedule_update()
+    
+    def cancel_update(self):
+        """Drop a pending deferred update, e.g. before the window it would paint goes away."""
+        if self._pending:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+    
+    def bind_drag(self, *scales):
+        """Track mouse drags on the given sliders for the coarse preview."""
+        for scale in scales:
+            scale.bind("<ButtonPress-1>", self.on_drag_start, add="+")
+            scale.bind("<ButtonRelease-1>", self.on_drag_end, add="+")
+    
+    def preview_corrections(self, wb, tint):
+        """Return wb and tint, snapped to 2-unit steps for a coarse preview while dragging."""
+        if self._dragging:
+            return round(wb * 0.5) * 2.0, round(tint * 0.5) * 2.0
+        return wb, tint
+    
+    def paint_background(self, color):
+        """Set the root window background, skipping the Tcl call if the color is unchanged."""
+        if color == self._last_bg:
+            return
+        self._last_bg = color
+        self._tk_call(self._root_path, 'configure', '-background', color)
 
 # ------------------ Calibration Stage ------------------
-class CalibrationApp:
+class CalibrationApp(BackgroundPainter):
     def __init__(self, root, finish_callback):
         """
         root: Tk root window, initially full-screen for calibration.
         finish_callback: function to call after calibration is finished.
         """
-        self.root = root
+        super().__init__(root)
         self.finish_callback = finish_callback
         self.calibration_values = {}
         self.current_index = 0
@@ -94,54 +236,54 @@ class CalibrationApp:
         self.overlay.title(f"Calibration: {self.current_level.capitalize()}")
         self.overlay.attributes("-topmost", True)
         self.create_controls()
-        self.center_overlay()
+        # Center once the pending layout has run, instead of forcing it with update_idletasks
+        self.overlay.after_idle(self.center_overlay)
     
     def create_controls(self):
         """Create sliders and a 'Next' button for calibration."""
+        # Slider values are read from DoubleVar traces, already typed as floats
+        self.wb_var = tk.DoubleVar(value=0.0)
         self.wb_scale = tk.Scale(self.overlay, from_=-50.0, to=50.0, resolution=0.1,
                                  orient=tk.HORIZONTAL, label="White Balance Correction",
-                                 length=400, command=self.on_wb_change)
-        self.wb_scale.set(0.0)
+                                 length=400, variable=self.wb_var)
         self.wb_scale.pack(padx=10, pady=10)
+        self.wb_var.trace_add('write', lambda *args: self._on_wb())
         
+        self.tint_var = tk.DoubleVar(value=0.0)
         self.tint_scale = tk.Scale(self.overlay, from_=-50.0, to=50.0, resolution=0.1,
                                    orient=tk.HORIZONTAL, label="Tint Correction",
-                                   length=400, command=self.on_tint_change)
-        self.tint_scale.set(0.0)
+                                   length=400, variable=self.tint_var)
         self.tint_scale.pack(padx=10, pady=10)
+        self.tint_var.trace_add('write', lambda *args: self._on_tint())
+        
+        self.bind_drag(self.wb_scale, self.tint_scale)
         
         self.next_button = tk.Button(self.overlay, text="Next", command=self.on_next)
         self.next_button.pack(pady=10)
     
     def center_overlay(self):
         """Center the overlay window on the screen."""
-        self.overlay.update_idletasks()
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
-        overlay_width = self.overlay.winfo_width()
-        overlay_height = self.overlay.winfo_height()
+        # Runs from after_idle, once pack has computed the overlay's requested size
+        overlay_width = self.overlay.winfo_reqwidth()
+        overlay_height = self.overlay.winfo_reqheight()
         x = (screen_width - overlay_width) // 2
         y = (screen_height - overlay_height) // 2
         self.overlay.geometry(f"+{x}+{y}")
     
-    def on_wb_change(self, val):
-        try:
-            self.current_wb = float(val)
-        except ValueError:
-            self.current_wb = 0.0
-        self.update_background()
+    def _on_wb(self):
+        self.current_wb = self.wb_var.get()
+        self.schedule_update()
     
-    def on_tint_change(self, val):
-        try:
-            self.current_tint = float(val)
-        except ValueError:
-            self.current_tint = 0.0
-        self.update_background()
+    def _on_tint(self):
+        self.current_tint = self.tint_var.get()
+        self.schedule_update()
     
     def update_background(self):
         """Update the main window's background based on the current calibration settings."""
-        color = compute_color(self.current_base, self.current_wb, self.current_tint)
-        self.root.configure(bg=color)
+        wb, tint = self.preview_corrections(self.current_wb, self.current_tint)
+        self.paint_background(compute_color(self.current_base, wb, tint))
     
     def on_next(self):
         """Save current calibration settings and move to the next brightness level or finish calibration."""
@@ -160,18 +302,19 @@ class CalibrationApp:
             self.update_background()
         else:
             # Calibration finished: save data and call the finish callback
+            self.cancel_update()
             save_calibration_data(self.calibration_values)
             self.overlay.destroy()
             self.finish_callback(self.calibration_values)
 
 # ------------------ Second Stage Setup ------------------
-class StageTwoUI:
+class StageTwoUI(BackgroundPainter):
     def __init__(self, root, calibration_data):
         """
         root: Main window (should be in windowed mode, maximized).
         calibration_data: Dictionary with monitor calibration data.
         """
-        self.root = root
+        super().__init__(root)
         self.calibration_data = calibration_data
         
         # Set up the control panel as a Toplevel window
@@ -186,9 +329,27 @@ class StageTwoUI:
         self.phone_temp_var = tk.StringVar(value="NA")
         self.user_wb_var = tk.DoubleVar(value=0.0)
         self.user_tint_var = tk.DoubleVar(value=0.0)
+        self.phone_profiles = {}  # Dictionary: profile name -> profile data
+        self.phone_profile_lines = []  # Raw lines of that file: (profile name or None, text)
+        self.phone_profiles_file = None  # File the current phone profiles were loaded from
+        # Labels currently shown in the phone file/profile menus, in menu order
+        # (each OptionMenu starts out with a single blank entry)
+        self._file_menu_items = [""]
+        self._profile_menu_items = [""]
+        # Base value and monitor calibration of the selected test color
+        self._active_base = 128
+        self._active_mwb = 0.0
+        self._active_mtint = 0.0
+        self.resolve_test_color()
+        # Phone temperature correction, re-parsed only when the temperature changes
+        self._phone_temp_corr = 0.0
+        self.phone_temp_var.trace_add('write', self._update_temp_corr)
         
         # Create UI controls
         self.create_widgets()
+        # One Tcl command per menu dispatches every entry by its label
+        self.panel.tk.createcommand("_pf_pick", self._pf_pick)
+        self.panel.tk.createcommand("_pp_pick", self._pp_pick)
         self.load_phone_files()
         self.panel.protocol("WM_DELETE_WINDOW", self.on_finish_setup)
         self.update_background()
@@ -220,16 +381,22 @@ class StageTwoUI:
         tk.Label(self.panel, text="User White Balance Correction:").grid(row=4, column=0, sticky="w", padx=5, pady=5)
         self.user_wb_scale = tk.Scale(self.panel, from_=-50.0, to=50.0, resolution=0.1,
                                       orient=tk.HORIZONTAL, variable=self.user_wb_var,
-                                      command=self.on_slider_change, length=300)
+                                      length=300)
         self.user_wb_scale.grid(row=4, column=1, padx=5, pady=5)
         
         # User Tint Correction slider (row 5)
         tk.Label(self.panel, text="User Tint Correction:").grid(row=5, column=0, sticky="w", padx=5, pady=5)
         self.user_tint_scale = tk.Scale(self.panel, from_=-50.0, to=50.0, resolution=0.1,
                                         orient=tk.HORIZONTAL, variable=self.user_tint_var,
-                                        command=self.on_slider_change, length=300)
+                                        length=300)
         self.user_tint_scale.grid(row=5, column=1, padx=5, pady=5)
         
+        # Slider values are read from DoubleVar traces instead of Scale commands
+        self.user_wb_var.trace_add('write', self.on_slider_change)
+        self.user_tint_var.trace_add('write', self.on_slider_change)
+        
+        self.bind_drag(self.user_wb_scale, self.user_tint_scale)
+        
         # Button to save changes to the selected profile (row 6)
         self.save_profile_button = tk.Button(self.panel, text="Save changes to profile", command=self.on_save_changes)
         self.save_profile_button.grid(row=6, column=0, columnspan=2, padx=5, pady=5)
@@ -240,14 +407,8 @@ class StageTwoUI:
     
     def load_phone_files(self):
         """Load list of phone profile files from the CCT_Settings directory."""
-        if not os.path.exists(CCT_SETTINGS_DIR):
-            os.makedirs(CCT_SETTINGS_DIR)
-        files = glob.glob(os.path.join(CCT_SETTINGS_DIR, "*.txt"))
-        file_names = [os.path.basename(f) for f in files]
-        menu = self.phone_file_menu["menu"]
-        menu.delete(0, "end")
-        for name in file_names:
-            menu.add_command(label=name, command=lambda value=name: self.phone_file_var.set(value))
+        file_names = list_phone_files()
+        self.sync_menu(self.phone_file_menu, self._file_menu_items, file_names, "_pf_pick")
         if file_names:
             # Set the first file as default and load its profiles
             self.phone_file_var.set(file_names[0])
@@ -258,29 +419,14 @@ class StageTwoUI:
     def load_phone_profiles(self, filename):
         """Load phone profiles from the selected file."""
         self.phone_profiles = {}  # Dictionary: profile name -> profile data
+        self.phone_profile_lines = []
+        self.phone_profiles_file = None
         filepath = os.path.join(CCT_SETTINGS_DIR, filename)
         if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    # Expected format: ProfileName | Temperature | WBCorrection | TintCorrection
-                    parts = [part.strip() for part in line.split("|")]
-                    if len(parts) < 4:
-                        continue
-                    profile_name, temperature, wb_corr, tint_corr = parts[:4]
-                    self.phone_profiles[profile_name] = {
-                        'temperature': temperature,
-                        'wb_correction': float(wb_corr) if wb_corr not in ["", "NA"] else 0.0,
-                        'tint_correction': float(tint_corr) if tint_corr not in ["", "NA"] else 0.0
-                    }
+            self.phone_profiles_file = filename
+            self.phone_profiles, self.phone_profile_lines = read_phone_profiles(filepath)
             # Update the phone profile OptionMenu
-            menu = self.phone_profile_menu["menu"]
-            menu.delete(0, "end")
-            # Updated lambda to call on_phone_profile_change so the temperature gets updated
-            for name in self.phone_profiles.keys():
-                menu.add_command(label=name, command=lambda value=name: self.on_phone_profile_change(value))
+            self.sync_menu(self.phone_profile_menu, self._profile_menu_items, self.phone_profiles, "_pp_pick")
             if self.phone_profiles:
                 first_profile = list(self.phone_profiles.keys())[0]
                 self.phone_profile_var.set(first_profile)
@@ -288,9 +434,58 @@ class StageTwoUI:
             else:
                 self.phone_profile_var.set("No profiles")
     
+    def sync_menu(self, option_menu, items, names, dispatch):
+        """
+        Make an OptionMenu show `names`, deleting and adding only the entries that changed.
+        items: list of labels currently in the menu, updated in place.
+        Each entry calls the Tcl command `dispatch` with its label.
+        """
+        call = self.panel.tk.call
+        menu = str(option_menu["menu"])
+        wanted = set(names)
+        # Delete from the end so the indexes of the remaining entries stay valid
+        for index in range(len(items) - 1, -1, -1):
+            if items[index] not in wanted:
+                call(menu, 'delete', index)
+                del items[index]
+        shown = set(items)
+        if items != [name for name in names if name in shown]:
+            # Surviving entries are out of order: rebuild so the menu follows `names`
+            call(menu, 'delete', 0, 'end')
+            del items[:]
+        # Surviving entries are now in order, so insert each new label at its target position
+        for index, name in enumerate(names):
+            if index < len(items) and items[index] == name:
+                continue
+            # A tuple becomes a Tcl list, so labels with spaces or braces stay one argument
+            if index < len(items):
+                call(menu, 'insert', index, 'command', '-label', name, '-command', (dispatch, name))
+            else:
+                call(menu, 'add', 'command', '-label', name, '-command', (dispatch, name))
+            items.insert(index, name)
+    
+    def _pf_pick(self, value):
+        self.phone_file_var.set(value)
+        self.on_phone_file_change(value)
+    
+    def _pp_pick(self, value):
+        # Update the menu selection and call on_phone_profile_change so the temperature gets updated
+        self.phone_profile_var.set(value)
+        self.on_phone_profile_change(value)
+    
     def on_test_color_change(self, value):
+        self.resolve_test_color()
         self.update_background()
     
+    def resolve_test_color(self):
+        """Cache the base value and monitor calibration for the selected test color."""
+        test_color_name = self.test_color_var.get()
+        self._active_base = test_color_values.get(test_color_name, 128)
+        # Monitor calibration is keyed by the lowercase level name
+        calib = self.calibration_data.get(test_color_name.lower(), {'white_balance': 0.0, 'tint': 0.0})
+        self._active_mwb = calib['white_balance']
+        self._active_mtint = calib['tint']
+    
     def on_phone_file_change(self, value):
         self.load_phone_profiles(value)
         self.update_background()
@@ -305,24 +500,8 @@ class StageTwoUI:
             self.phone_temp_var.set(profile['temperature'])
         self.update_background()
     
-    def on_slider_change(self, value):
-        self.update_background()
-    
-    def update_background(self):
-        """
-        Update the main window background based on the test color, monitor calibration,
-        phone profile corrections (including temperature) and user corrections.
-        """
-        # Get test color base value
-        test_color_name = self.test_color_var.get()
-        base = test_color_values.get(test_color_name, 128)
-        
-        # Get monitor calibration for the test color (using lowercase key)
-        calib = self.calibration_data.get(test_color_name.lower(), {'white_balance': 0.0, 'tint': 0.0})
-        monitor_wb = calib['white_balance']
-        monitor_tint = calib['tint']
-        
-        # Get phone profile temperature correction from the entry (if not "NA")
+    def _update_temp_corr(self, *args):
+        """Parse the phone temperature entry (if not "NA") into a white balance correction."""
         phone_temp_corr = 0.0
         temp_str = self.phone_temp_var.get().strip()
         if temp_str.upper() != "NA" and temp_str != "":
@@ -332,60 +511,56 @@ class StageTwoUI:
                 phone_temp_corr = (temp_val - 6500) / 100.0
             except:
                 phone_temp_corr = 0.0
-        
+        self._phone_temp_corr = phone_temp_corr
+        # Typing in the temperature entry fires on every keystroke, so wait a bit longer
+        self.schedule_update(100)
+    
+    def on_slider_change(self, *args):
+        self.schedule_update()
+    
+    def update_background(self):
+        """
+        Update the main window background based on the test color, monitor calibration,
+        phone profile corrections (including temperature) and user corrections.
+        """
         # Get user corrections from the sliders
         user_wb = self.user_wb_var.get()
         user_tint = self.user_tint_var.get()
         
         # Compute final corrections
-        final_wb = monitor_wb + phone_temp_corr + user_wb
-        final_tint = monitor_tint + user_tint
+        final_wb = self._active_mwb + self._phone_temp_corr + user_wb
+        final_tint = self._active_mtint + user_tint
+        final_wb, final_tint = self.preview_corrections(final_wb, final_tint)
         
-        final_color = compute_color(base, final_wb, final_tint)
-        self.root.configure(bg=final_color)
+        self.paint_background(compute_color(self._active_base, final_wb, final_tint))
     
     def on_save_changes(self):
         """Save the changes to the selected phone profile back to its file."""
-        phone_file = self.phone_file_var.get()
-        if not phone_file or phone_file in ["No files found"]:
+        # Write back to the file the profiles were loaded from, which the profile menu reflects
+        phone_file = self.phone_profiles_file
+        selected_profile = self.phone_profile_var.get()
+        if not phone_file or selected_profile not in self.phone_profiles:
             return
         filepath = os.path.join(CCT_SETTINGS_DIR, phone_file)
-        # Read all lines from the file
-        lines = []
-        if os.path.exists(filepath):
-            with open(filepath, 'r') as f:
-                lines = f.readlines()
-        # Update the line corresponding to the selected profile
-        selected_profile = self.phone_profile_var.get()
-        new_lines = []
-        for line in lines:
-            line_strip = line.strip()
-            if not line_strip:
-                continue
-            parts = [part.strip() for part in line_strip.split("|")]
-            if len(parts) < 4:
-                new_lines.append(line)
-                continue
-            profile_name = parts[0]
-            if profile_name == selected_profile:
-                # Build new line with updated corrections and temperature (temperature is taken from the entry)
-                temperature = self.phone_temp_var.get().strip()
-                new_wb = f"{self.user_wb_var.get():.1f}"
-                new_tint = f"{self.user_tint_var.get():.1f}"
-                new_line = f"{profile_name} | {temperature} | {new_wb} | {new_tint}\n"
-                new_lines.append(new_line)
-                # Also update in our internal dictionary
-                self.phone_profiles[profile_name]['temperature'] = temperature
-                self.phone_profiles[profile_name]['wb_correction'] = float(new_wb)
-                self.phone_profiles[profile_name]['tint_correction'] = float(new_tint)
-            else:
-                new_lines.append(line)
-        with open(filepath, 'w') as f:
-            f.writelines(new_lines)
-        print("Profile changes saved.")
+        # Update the selected profile in our internal dictionary (temperature is taken from the entry)
+        profile = self.phone_profiles[selected_profile]
+        profile['temperature'] = self.phone_temp_var.get().strip()
+        profile['wb_correction'] = round(self.user_wb_var.get(), 1)
+        profile['tint_correction'] = round(self.user_tint_var.get(), 1)
+        # Rebuild the file in one pass: only the selected profile's line(s) are re-formatted,
+        # every other line (comments, other profiles, extra columns) is written back verbatim
+        new_line = _PROFILE_FMT(selected_profile, profile['temperature'],
+                                profile['wb_correction'], profile['tint_correction'])
+        # The re-formatted line keeps the line ending of the line it replaces
+        self.phone_profile_lines = [
+            (name, new_line + (line[len(line.rstrip('\r\n')):] or '\n') if name == selected_profile else line)
+            for name, line in self.phone_profile_lines]
+        text = ''.join(line for name, line in self.phone_profile_lines)
+        write_file_async(filepath, text, "Profile changes saved.")
     
     def on_finish_setup(self):
         """Finish the setup by closing the program."""
+        self.cancel_update()
         self.panel.destroy()
         self.root.destroy()
 
@@ -406,6 +581,7 @@ def run_stage_two(root, calibration_data):
 
 # ------------------ Main Program ------------------
 def main():
+    logging.basicConfig(level=logging.INFO)
     root = tk.Tk()
     # If the monitor calibration file exists and is not empty, load calibration data and run stage two
     if os.path.exists(CALIBRATION_FILE) and os.path.getsize(CALIBRATION_FILE) > 0:
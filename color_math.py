@@ -0,0 +1,64 @@
+"""
+Color math shared by the calibration GUI and headless callers.
+
+Nothing here depends on Tk, so colors can be generated from scripts
+without creating a window.
+"""
+import math
+import functools
+
+# Precomputed two-digit hex strings for every channel value (0-255), used to build
+# "#rrggbb" colors by indexing instead of per-call format-spec parsing
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
+def clamp(value, min_val=0, max_val=255):
+    """Clamp the value within the specified range and return an integer."""
+    # Round half up and clamp with plain comparisons instead of nested max/min calls
+    v = math.floor(value + 0.5)
+    v = v if v > min_val else min_val
+    return v if v < max_val else max_val
+
+def compute_color(base, wb, tint):
+    """
+    Compute the final color.
+    The white balance (wb) correction increases red and decreases blue;
+    the tint correction is applied to the green channel.
+    """
+    r = clamp(base + wb)
+    g = clamp(base + tint)
+    b = clamp(base - wb)
+    return _hex_color(r, g, b)
+
+@functools.lru_cache(maxsize=4096)
+def _hex_color(r, g, b):
+    """Build the '#rrggbb' string for clamped channel values; memoized since drags revisit the same colors."""
+    return "#" + _HEX[r] + _HEX[g] + _HEX[b]
+
+def render_colors(bases, wbs, tints):
+    """
+    Compute a batch of colors without Tk.
+    bases, wbs and tints are equal-length sequences; returns a list of '#rrggbb' strings.
+    """
+    return [compute_color(base, wb, tint) for base, wb, tint in zip(bases, wbs, tints)]
+
+def render_grid(base, wb_min, wb_step, tint_min, tint_step, rows, cols):
+    """
+    Render a rows x cols preview pad of colors around one base value.
+    White balance grows along each row and tint down each column.
+    Returns the pixels as packed RGB bytes, row by row.
+    """
+    # Red and blue depend only on the column and green only on the row,
+    # so each channel is clamped once per column/row instead of once per pixel
+    wbs = [wb_min + j * wb_step for j in range(cols)]
+    row = bytearray(cols * 3)
+    row[0::3] = bytes(clamp(base + wb) for wb in wbs)
+    row[2::3] = bytes(clamp(base - wb) for wb in wbs)
+    pixels = bytearray()
+    for i in range(rows):
+        row[1::3] = bytes((clamp(base + tint_min + i * tint_step),)) * cols
+        pixels += row
+    return bytes(pixels)
+
+def grid_to_ppm(pixels, rows, cols):
+    """Wrap render_grid output in a binary PPM header, e.g. for tk.PhotoImage(data=...)."""
+    return b"P6 %d %d 255\n" % (cols, rows) + pixels